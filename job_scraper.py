@@ -1,13 +1,15 @@
 import os
+import csv
 import json
-import pandas as pd
-from bs4 import BeautifulSoup
+import asyncio
+import httpx
+from selectolax.lexbor import LexborHTMLParser
 import logging
+from functools import lru_cache
 from typing import List, Dict, Optional
-from datetime import datetime
-from urllib.parse import urljoin
-from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
-import time
+from datetime import datetime, timezone
+from urllib.parse import urljoin, urlparse
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeout
 
 # Configure logging
 logging.basicConfig(
@@ -16,10 +18,96 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+_USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36'
+
+# Resource types the scraper never reads; aborting them cuts page weight
+# and speeds up load. Drop 'stylesheet' if CSS-driven hide/show matters
+_BLOCKED_RESOURCE_TYPES = {'image', 'font', 'media', 'stylesheet'}
+
+# Selector groups are built once at import time; the per-call lists they
+# replace were re-tokenized by the CSS engine for every job element
+_JOB_LIST_SELECTORS = (
+    'div[class*="job-"]',
+    'div[class*="career-"]',
+    'div[class*="position-"]',
+    '.job-listing',
+    '.careers-list',
+    '.jobs-list',
+    '.positions-list',
+    '.job-posting',
+    '.career-posting',
+    '.position-posting',
+    '.jobs-list-item',
+    '.career-opportunities',
+    '.vacancy-item'
+)
+
+# Combined form for single-shot queries and waits
+_JOB_LIST_SELECTOR = ', '.join(_JOB_LIST_SELECTORS)
+
+# Per-field groups are combined into one selector string so each field
+# costs a single css_first() tree walk instead of one per alternative.
+# Title and description keep a strong/weak tier because css_first
+# returns the first match in document order, not selector order
+_TITLE_SELECTOR = 'h1, h2, h3, h4, h5, h6, [class*="title"], [class*="position"], [class*="role"], [class*="job-name"]'
+_TITLE_FALLBACK_SELECTOR = 'a'
+
+_LOCATION_SELECTOR = '[class*="location"], [class*="place"], [class*="city"], [class*="region"], [data-location], [class*="address"]'
+
+_DESCRIPTION_SELECTOR = '[class*="description"], [class*="summary"], [class*="details"], [class*="content"]'
+_DESCRIPTION_FALLBACK_SELECTOR = 'p'
+
+_DATE_SELECTOR = '[class*="date"], [class*="posted"], [class*="published"], time, [datetime]'
+
+_DEPARTMENT_SELECTOR = '[class*="department"], [class*="team"], [class*="category"], [class*="function"]'
+
+_EMPLOYMENT_TYPE_SELECTOR = '[class*="type"], [class*="employment"], [class*="contract"], [class*="work-type"]'
+
+# Pages with at least this many job elements get their extraction
+# offloaded to threads; selectolax releases the GIL during CSS queries
+_PARALLEL_EXTRACT_THRESHOLD = 100
+
+# Validators (ETag / Last-Modified) and extracted rows from previous
+# runs; unchanged pages answer 304 and replay their cached rows
+_ETAG_CACHE_FILE = '.etag_cache.json'
+
+_CSV_FIELDS = (
+    'company',
+    'title',
+    'location',
+    'description',
+    'url',
+    'source_url',
+    'date_posted',
+    'department',
+    'employment_type',
+    'scraped_date'
+)
+
+@lru_cache(maxsize=256)
+def _company_from_url(url: str) -> str:
+    """Extract company name from URL (memoized; called once per job)"""
+    try:
+        hostname = urlparse(url).hostname or ''
+        if hostname.startswith('www.'):
+            hostname = hostname[4:]
+        company = hostname.split('.')[0]
+        return company.capitalize() if company else url
+    except ValueError:
+        return url
+
 class JobScraper:
-    def __init__(self, config_file: str = "config.json"):
+    def __init__(self, config_file: str = "config.json", max_concurrency: int = 5):
         self.config_file = config_file
-        self.jobs_data = []
+        self.max_concurrency = max_concurrency
+        self._semaphore = None
+        self._browser = None
+        self._http = None
+        self._csv_file = None
+        self._csv_writer = None
+        self._output_file = None
+        self._jobs_written = 0
+        self._etag_cache = {}
         
     def load_config(self) -> List[str]:
         """Load career page URLs from config file"""
@@ -34,276 +122,373 @@ class JobScraper:
             logger.error("Invalid JSON in config file")
             return []
 
-    def scrape_jobs(self, url: str) -> List[Dict]:
-        """Scrape jobs from a single career page"""
+    def _load_etag_cache(self):
+        """Load validators saved by previous runs"""
+        try:
+            with open(_ETAG_CACHE_FILE, 'r') as f:
+                self._etag_cache = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self._etag_cache = {}
+
+    def _save_etag_cache(self):
+        """Persist validators for the next run"""
+        if not self._etag_cache:
+            return
+        with open(_ETAG_CACHE_FILE, 'w') as f:
+            json.dump(self._etag_cache, f)
+
+    async def _try_static(self, url: str) -> Optional[List[Dict]]:
+        """Try to scrape a server-rendered page with plain HTTP
+
+        Returns the jobs if the static HTML already contains job listings
+        (replayed from cache when the page is unchanged since the last
+        run), or None if the page needs a real browser.
+        """
+        headers = {}
+        cached = self._etag_cache.get(url, {})
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+
+        try:
+            response = await self._http.get(url, headers=headers)
+            if response.status_code == 304:
+                # Replay the rows cached with the validators; every run
+                # writes a fresh CSV, so skipping would drop these jobs
+                # from the output
+                cached_jobs = cached.get('jobs', [])
+                logger.info(f"{url} unchanged since last run, replaying {len(cached_jobs)} cached jobs")
+                return cached_jobs
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.info(f"Static fetch failed for {url}: {str(e)}")
+            return None
+
+        tree = LexborHTMLParser(response.text)
+        if tree.css_first(_JOB_LIST_SELECTOR) is None:
+            return None
+
+        logger.info(f"Scraped {url} from static HTML without a browser")
+        jobs = await self._extract_jobs(tree, url)
+
+        # Validators are only useful with the rows to replay on a 304
+        validators = {}
+        if response.headers.get('etag'):
+            validators['etag'] = response.headers['etag']
+        if response.headers.get('last-modified'):
+            validators['last_modified'] = response.headers['last-modified']
+        if validators:
+            validators['jobs'] = jobs
+            self._etag_cache[url] = validators
+
+        return jobs
+
+    async def scrape_jobs(self, browser, url: str) -> List[Dict]:
+        """Scrape jobs from a single career page using a shared browser"""
+        # Fast path: many career pages are server-rendered, so a plain
+        # HTTP fetch avoids the browser entirely
         try:
-            with sync_playwright() as p:
-                # Launch browser with stealth mode
-                browser = p.chromium.launch(headless=True)
-                context = browser.new_context(
-                    user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36',
+            jobs = await self._try_static(url)
+        except Exception as e:
+            logger.error(f"Error scraping {url}: {str(e)}")
+            return []
+        if jobs is not None:
+            return jobs
+
+        async with self._semaphore:
+            context = None
+            try:
+                # New context per URL is cheap; the browser itself is shared
+                context = await browser.new_context(
+                    user_agent=_USER_AGENT,
                     viewport={'width': 1920, 'height': 1080},
                     device_scale_factor=1,
+                    bypass_csp=True,
                 )
-                
+
+                # Block heavy resources; only the HTML text is read
+                async def block_heavy(route):
+                    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+                        await route.abort()
+                    else:
+                        await route.continue_()
+
+                await context.route('**/*', block_heavy)
+
                 # Add stealth scripts
-                context.add_init_script("""
+                await context.add_init_script("""
                     Object.defineProperty(navigator, 'webdriver', {
                         get: () => undefined
                     });
                 """)
-                
-                page = context.new_page()
-                
+
+                page = await context.new_page()
+
                 # Set longer timeout for initial load
                 page.set_default_timeout(60000)
-                
+
                 # Navigate to URL
                 logger.info(f"Navigating to {url}")
                 try:
-                    page.goto(url, wait_until='networkidle', timeout=60000)
+                    await page.goto(url, wait_until='domcontentloaded', timeout=30000)
                 except PlaywrightTimeout:
-                    logger.warning(f"Timeout waiting for networkidle on {url}, proceeding anyway")
-                
-                # Scroll to load dynamic content
-                for _ in range(3):
-                    page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                    time.sleep(2)
-                
-                # Wait for common job listing selectors
-                selectors = [
-                    'div[class*="job-"]',
-                    'div[class*="career-"]',
-                    'div[class*="position-"]',
-                    '.job-listing',
-                    '.careers-list',
-                    '.jobs-list',
-                    '.positions-list',
-                    '.job-posting',
-                    '.career-posting',
-                    '.position-posting',
-                    '.jobs-list-item',
-                    '.career-opportunities',
-                    '.vacancy-item'
-                ]
-                
-                for selector in selectors:
-                    try:
-                        page.wait_for_selector(selector, timeout=5000)
-                        break
-                    except PlaywrightTimeout:
-                        continue
-                
-                # Get page content
-                content = page.content()
-                soup = BeautifulSoup(content, 'lxml')
-                
-                # Try different common selectors for job listings
-                job_elements = []
-                for selector in selectors:
-                    job_elements = soup.select(selector)
-                    if job_elements:
-                        logger.info(f"Found job elements using selector: {selector}")
-                        break
-                
-                if not job_elements:
-                    # Try finding job listings by looking for common patterns
-                    job_elements = []
-                    patterns = [
-                        # Look for elements containing job-related text
-                        lambda tag: tag.name in ['div', 'article', 'li'] and any(
-                            keyword in (tag.get('class', []) + [tag.get_text().lower()])
-                            for keyword in ['job', 'career', 'position', 'vacancy', 'opening']
-                        ),
-                        # Look for elements with job titles
-                        lambda tag: tag.find(['h1', 'h2', 'h3', 'h4', 'h5', 'h6']) is not None
-                    ]
-                    
-                    for pattern in patterns:
-                        job_elements = soup.find_all(pattern)
-                        if job_elements:
-                            logger.info(f"Found job elements using pattern matching")
-                            break
-                
-                jobs = []
-                for job in job_elements:
-                    job_data = {
-                        'company': self._extract_company_name(url),
-                        'title': self._extract_job_title(job),
-                        'location': self._extract_location(job),
-                        'description': self._extract_description(job),
-                        'url': self._extract_job_url(job, url),
-                        'source_url': url,
-                        'date_posted': self._extract_date_posted(job),
-                        'department': self._extract_department(job),
-                        'employment_type': self._extract_employment_type(job),
-                        'scraped_date': datetime.now().isoformat()
+                    logger.warning(f"Timeout waiting for domcontentloaded on {url}, proceeding anyway")
+
+                # Wait for the actual job listings rather than network
+                # idle, which analytics-heavy sites can delay for minutes
+                try:
+                    await page.wait_for_selector(_JOB_LIST_SELECTOR, timeout=10000, state='attached')
+                except PlaywrightTimeout:
+                    logger.warning(f"No job listing selector appeared on {url}, proceeding anyway")
+
+                # Scroll to load dynamic content, stopping as soon as the
+                # page height is stable instead of sleeping a fixed 6s
+                await page.evaluate("""async () => {
+                    let height = 0;
+                    for (let i = 0; i < 5; i++) {
+                        window.scrollTo(0, document.body.scrollHeight);
+                        await new Promise(resolve => setTimeout(resolve, 300));
+                        if (document.body.scrollHeight === height) break;
+                        height = document.body.scrollHeight;
                     }
-                    if job_data['title']:  # Only add if we found at least a job title
-                        jobs.append(job_data)
-                
-                # Close browser
-                browser.close()
-                return jobs
-                
-        except Exception as e:
-            logger.error(f"Error scraping {url}: {str(e)}")
-            return []
+                }""")
+
+                # Get page content, narrowed to the smallest likely root:
+                # full-page HTML drags head scripts and inline JSON-LD
+                # into the parser for no benefit
+                content = await page.evaluate(
+                    "() => (document.querySelector('main') || "
+                    "document.querySelector('#content') || "
+                    "document.querySelector('.careers') || "
+                    "document.body).outerHTML"
+                )
+                return await self._extract_jobs(LexborHTMLParser(content), url)
+
+            except Exception as e:
+                logger.error(f"Error scraping {url}: {str(e)}")
+                return []
+            finally:
+                # Close the per-URL context; the browser is shared
+                if context is not None:
+                    await context.close()
+
+    async def _extract_jobs(self, tree, url: str) -> List[Dict]:
+        """Extract job listings from a parsed page"""
+        # Try different common selectors for job listings
+        job_elements = []
+        for selector in _JOB_LIST_SELECTORS:
+            job_elements = tree.css(selector)
+            if job_elements:
+                logger.info(f"Found job elements using selector: {selector}")
+                break
+
+        if not job_elements:
+            # Try finding job listings by looking for common patterns:
+            # selectolax has no callable predicates, so query the
+            # structural part in C and filter the rest in Python
+            candidates = tree.css('div, article, li')
+            keywords = ('job', 'career', 'position', 'vacancy', 'opening')
+            job_elements = [
+                c for c in candidates
+                # Cap text inspection at 200 chars so a page-sized
+                # container does not get lower-cased wholesale
+                if any(
+                    keyword in (c.attributes.get('class') or '').lower()
+                    or keyword in c.text()[:200].lower()
+                    for keyword in keywords
+                )
+            ]
+            if not job_elements:
+                # Treat containers of headings as potential listings,
+                # walking up from the headings rather than probing every
+                # candidate with its own sub-query; dedup so a container
+                # with several headings yields one job element
+                job_elements = list(dict.fromkeys(
+                    h.parent for h in tree.css('h1, h2, h3, h4, h5, h6')
+                    if h.parent is not None and h.parent.tag in ('div', 'article', 'li')
+                ))
+            if job_elements:
+                logger.info(f"Found job elements using pattern matching")
+
+        company = _company_from_url(url)
+        # One timestamp per page; UTC for cross-timezone reproducibility
+        scraped_ts = datetime.now(timezone.utc).isoformat()
+        if len(job_elements) >= _PARALLEL_EXTRACT_THRESHOLD:
+            # The per-element queries run in C with the GIL released, so
+            # threads give real parallelism on listing-heavy pages, and
+            # awaiting them keeps the event loop free for the other URLs
+            jobs = list(await asyncio.gather(*(
+                asyncio.to_thread(self._build_job_dict, e, url, company, scraped_ts)
+                for e in job_elements
+            )))
+        else:
+            jobs = [self._build_job_dict(e, url, company, scraped_ts) for e in job_elements]
+
+        # Only keep jobs with at least a title
+        return [job for job in jobs if job['title']]
+
+    def _build_job_dict(self, element, url: str, company: str, scraped_ts: str) -> Dict:
+        """Extract every field of one job element into a dict"""
+        return {
+            'company': company,
+            'title': self._extract_job_title(element),
+            'location': self._extract_location(element),
+            'description': self._extract_description(element),
+            'url': self._extract_job_url(element, url),
+            'source_url': url,
+            'date_posted': self._extract_date_posted(element),
+            'department': self._extract_department(element),
+            'employment_type': self._extract_employment_type(element),
+            'scraped_date': scraped_ts
+        }
 
     def _extract_job_title(self, element) -> str:
-        """Extract job title using multiple possible selectors"""
-        selectors = [
-            'h1, h2, h3, h4, h5, h6',
-            '[class*="title"]',
-            '[class*="position"]',
-            '[class*="role"]',
-            '[class*="job-name"]',
-            'a'
-        ]
-        for selector in selectors:
-            title = self._extract_text(element, selector)
-            if title:
-                return title.strip()
-        return ""
+        """Extract job title using a single combined selector"""
+        title = self._extract_text(element, _TITLE_SELECTOR)
+        if not title:
+            title = self._extract_text(element, _TITLE_FALLBACK_SELECTOR)
+        return title.strip()
 
     def _extract_location(self, element) -> str:
         """Extract job location"""
-        location_selectors = [
-            '[class*="location"]',
-            '[class*="place"]',
-            '[class*="city"]',
-            '[class*="region"]',
-            '[data-location]',
-            '[class*="address"]'
-        ]
-        for selector in location_selectors:
-            location = self._extract_text(element, selector)
-            if location:
-                return location.strip()
-        return ""
+        return self._extract_text(element, _LOCATION_SELECTOR).strip()
 
     def _extract_description(self, element) -> str:
         """Extract job description"""
-        desc_selectors = [
-            '[class*="description"]',
-            '[class*="summary"]',
-            '[class*="details"]',
-            '[class*="content"]',
-            'p'
-        ]
-        for selector in desc_selectors:
-            desc = self._extract_text(element, selector)
-            if desc:
-                return desc.strip()
-        return ""
+        desc = self._extract_text(element, _DESCRIPTION_SELECTOR)
+        if not desc:
+            desc = self._extract_text(element, _DESCRIPTION_FALLBACK_SELECTOR)
+        return desc.strip()
 
     def _extract_job_url(self, element, base_url: str) -> str:
         """Extract job URL and make it absolute"""
         try:
             # First try finding a direct link
-            link = element.find('a')
-            if link and 'href' in link.attrs:
-                return urljoin(base_url, link['href'])
-            
+            link = element.css_first('a')
+            if link is not None and link.attributes.get('href'):
+                return urljoin(base_url, link.attributes['href'])
+
             # Try finding a link in parent elements
             parent = element.parent
             for _ in range(3):  # Check up to 3 levels up
-                if parent:
-                    link = parent.find('a')
-                    if link and 'href' in link.attrs:
-                        return urljoin(base_url, link['href'])
+                if parent is not None:
+                    link = parent.css_first('a')
+                    if link is not None and link.attributes.get('href'):
+                        return urljoin(base_url, link.attributes['href'])
                     parent = parent.parent
             return ""
-        except (AttributeError, TypeError):
+        except (AttributeError, TypeError, ValueError):
+            # ValueError covers urljoin on malformed hrefs
             return ""
 
     def _extract_date_posted(self, element) -> Optional[str]:
-        """Extract job posting date"""
-        date_selectors = [
-            '[class*="date"]',
-            '[class*="posted"]',
-            '[class*="published"]',
-            'time',
-            '[datetime]'
-        ]
-        for selector in date_selectors:
-            date = self._extract_text(element, selector)
-            if date:
-                return date.strip()
-        return None
+        """Extract job posting date, preferring machine-readable values"""
+        # A time[datetime] attribute is already ISO-formatted; rendered
+        # text is a locale-dependent last resort
+        timestamp = element.css_first('time[datetime]')
+        if timestamp is not None and timestamp.attributes.get('datetime'):
+            return timestamp.attributes['datetime']
+
+        date = self._extract_text(element, _DATE_SELECTOR)
+        return date.strip() if date else None
 
     def _extract_department(self, element) -> str:
         """Extract job department"""
-        dept_selectors = [
-            '[class*="department"]',
-            '[class*="team"]',
-            '[class*="category"]',
-            '[class*="function"]'
-        ]
-        for selector in dept_selectors:
-            dept = self._extract_text(element, selector)
-            if dept:
-                return dept.strip()
-        return ""
+        return self._extract_text(element, _DEPARTMENT_SELECTOR).strip()
 
     def _extract_employment_type(self, element) -> str:
         """Extract employment type"""
-        type_selectors = [
-            '[class*="type"]',
-            '[class*="employment"]',
-            '[class*="contract"]',
-            '[class*="work-type"]'
-        ]
-        for selector in type_selectors:
-            emp_type = self._extract_text(element, selector)
-            if emp_type:
-                return emp_type.strip()
-        return ""
+        return self._extract_text(element, _EMPLOYMENT_TYPE_SELECTOR).strip()
 
     def _extract_text(self, element, selector: str) -> str:
-        """Extract text from an element using a selector"""
+        """Extract text from an element's descendants using a selector"""
         try:
-            found = element.select_one(selector)
-            if not found:
-                found = element.find(selector)
-            return found.get_text(strip=True) if found else ""
+            # css() can match the element itself; a container whose class
+            # matches a field selector must not swallow the whole card's
+            # text, so only descendants count
+            for found in element.css(selector):
+                if found != element:
+                    return found.text(strip=True)
+            return ""
         except (AttributeError, TypeError):
             return ""
 
-    def _extract_company_name(self, url: str) -> str:
-        """Extract company name from URL"""
-        try:
-            domain = url.split('//')[1].split('/')[0]
-            company = domain.replace('www.', '').split('.')[0]
-            return company.capitalize()
-        except:
-            return url
+    def _write_jobs(self, jobs: List[Dict]):
+        """Stream jobs to the CSV file, opening it on first write"""
+        if not jobs:
+            return
+        if self._csv_writer is None:
+            self._output_file = f"jobs_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+            self._csv_file = open(self._output_file, 'w', newline='', encoding='utf-8')
+            self._csv_writer = csv.DictWriter(self._csv_file, fieldnames=_CSV_FIELDS)
+            self._csv_writer.writeheader()
 
-    def run(self):
-        """Run the scraper for all URLs in config"""
-        urls = self.load_config()
+        self._csv_writer.writerows(jobs)
+        self._jobs_written += len(jobs)
+
+    def _close_csv(self):
+        """Close the CSV file and log the final count"""
+        if self._csv_file is None:
+            logger.warning("No jobs data to save")
+            return
+        self._csv_file.close()
+        self._csv_file = None
+        self._csv_writer = None
+        logger.info(f"Saved {self._jobs_written} jobs to {self._output_file}")
+
+    async def _scrape_and_write(self, browser, url: str):
+        """Scrape one URL and stream its jobs straight to the CSV"""
+        jobs = await self.scrape_jobs(browser, url)
+        self._write_jobs(jobs)
+        logger.info(f"Found {len(jobs)} jobs from {url}")
+
+    async def _run_async(self):
+        """Scrape all URLs concurrently with a single shared browser"""
+        # Dedup while preserving config order; duplicates would trigger
+        # redundant browser work
+        urls = list(dict.fromkeys(self.load_config()))
         if not urls:
             logger.error("No URLs found in config file")
             return
 
-        for url in urls:
-            logger.info(f"Scraping jobs from {url}")
-            jobs = self.scrape_jobs(url)
-            self.jobs_data.extend(jobs)
-            logger.info(f"Found {len(jobs)} jobs from {url}")
-
-        self.save_to_csv()
+        self._load_etag_cache()
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
 
-    def save_to_csv(self):
-        """Save scraped jobs to CSV file"""
-        if not self.jobs_data:
-            logger.warning("No jobs data to save")
-            return
+        try:
+            # One AsyncClient for the whole run, so the static fast path
+            # reuses connections across URLs
+            async with httpx.AsyncClient(
+                headers={'User-Agent': _USER_AGENT},
+                timeout=10,
+                follow_redirects=True
+            ) as client:
+                self._http = client
+                async with async_playwright() as p:
+                    # Connect to a warm browser kept alive by serve.py if one
+                    # is advertised, otherwise pay the cold start ourselves
+                    cdp_endpoint = os.environ.get('BROWSER_CDP')
+                    if cdp_endpoint:
+                        logger.info(f"Connecting to browser server at {cdp_endpoint}")
+                        self._browser = await p.chromium.connect_over_cdp(cdp_endpoint)
+                    else:
+                        self._browser = await p.chromium.launch(headless=True)
+                    try:
+                        await asyncio.gather(
+                            *(self._scrape_and_write(self._browser, url) for url in urls)
+                        )
+                    finally:
+                        await self._browser.close()
+                        self._browser = None
+                self._http = None
+        finally:
+            # Flush what was scraped even if a URL aborted the run
+            self._save_etag_cache()
+            self._close_csv()
 
-        df = pd.DataFrame(self.jobs_data)
-        output_file = f"jobs_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-        df.to_csv(output_file, index=False, encoding='utf-8')
-        logger.info(f"Saved {len(self.jobs_data)} jobs to {output_file}")
+    def run(self):
+        """Run the scraper for all URLs in config"""
+        asyncio.run(self._run_async())
 
 if __name__ == "__main__":
     scraper = JobScraper()
@@ -0,0 +1,40 @@
+import time
+import logging
+from playwright.sync_api import sync_playwright
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+CDP_PORT = 9222
+
+def main():
+    """Keep a warm Chromium alive for repeated scraper runs
+
+    Run this once and export the printed endpoint as BROWSER_CDP; each
+    job_scraper.py invocation then connects over the Chrome DevTools
+    Protocol instead of paying the browser cold start.
+    """
+    with sync_playwright() as p:
+        # The Python bindings have no launch_server, so expose the
+        # browser over CDP instead
+        browser = p.chromium.launch(
+            headless=True,
+            args=[f'--remote-debugging-port={CDP_PORT}']
+        )
+        endpoint = f'http://127.0.0.1:{CDP_PORT}'
+        print(endpoint)
+        logger.info(f"Browser server running; export BROWSER_CDP={endpoint}")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            logger.info("Shutting down browser server")
+        finally:
+            browser.close()
+
+if __name__ == "__main__":
+    main()